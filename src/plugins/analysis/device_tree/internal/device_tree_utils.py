@@ -61,7 +61,7 @@ class StructureBlock:
             self.raw = self.raw[next_property_offset + prop.get_size():]
 
 
-def parse_dtb_header(raw: bytes) -> DeviceTreeHeader:
+def parse_dtb_header(raw: Union[bytes, memoryview]) -> DeviceTreeHeader:
     return DeviceTreeHeader(*[_bytes_to_int(chunk) for chunk in chunked(raw[4:HEADER_SIZE], 4)])
 
 
@@ -90,32 +90,28 @@ def convert_device_tree_to_str(file_path: Union[str, Path]) -> Optional[str]:
 
 
 def dump_device_trees(raw: bytes) -> List[dict]:
-    total_offset = 0
     dumped_device_trees = []
+    raw_view = memoryview(raw)  # avoid copying the remaining input for every magic match
 
-    while MAGIC in raw:
-        offset = raw.find(MAGIC)
-        raw = raw[offset:]
-        total_offset += offset
-
-        json_result = analyze_device_tree(raw)
+    offset = raw.find(MAGIC)
+    while offset != -1:
+        json_result = analyze_device_tree(raw_view[offset:])
         if json_result:
-            json_result['offset'] = total_offset
+            json_result['offset'] = offset
             dumped_device_trees.append(json_result)
 
         # only skip HEADER_SIZE ahead because device trees might be inside other device trees
-        raw = raw[HEADER_SIZE:]
-        total_offset += HEADER_SIZE
+        offset = raw.find(MAGIC, offset + HEADER_SIZE)
 
     return dumped_device_trees
 
 
-def analyze_device_tree(raw: bytes) -> Optional[dict]:
+def analyze_device_tree(raw: Union[bytes, memoryview]) -> Optional[dict]:
     header = parse_dtb_header(raw)
     if header_has_illegal_values(header, len(raw)):
         return None  # probably false positive
 
-    device_tree = raw[:header.size]
+    device_tree = bytes(raw[:header.size])
     strings_block = device_tree[header.strings_block_offset:header.strings_block_offset + header.strings_block_size]
     structure_block = device_tree[header.struct_block_offset:header.struct_block_offset + header.struct_block_size]
     strings_by_offset = {strings_block.find(s): s for s in strings_block.split(b'\0') if s}
@@ -1,9 +1,11 @@
+# pylint: disable=redefined-outer-name,unused-argument,wrong-import-order
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from objects.file import FileObject
-from test.unit.analysis.analysis_plugin_test_class import AnalysisPluginTest  # pylint: disable=wrong-import-order
+from test.common_helper import get_config_for_testing
 
 from ..code.device_tree import AnalysisPlugin
 from ..internal.device_tree_utils import dump_device_trees
@@ -16,38 +18,85 @@ TEST_FP = TEST_DATA / 'false_positive.rnd'
 TEST_BROKEN = TEST_DATA / 'broken.dtb'
 
 
-class TestDeviceTree(AnalysisPluginTest):
+class MockAdmin:
+    def register_plugin(self, name, administrator):
+        pass
 
-    PLUGIN_NAME = AnalysisPlugin.NAME
 
-    def setUp(self):
-        super().setUp()
-        config = self.init_basic_config()
+@pytest.fixture(scope='session')
+def device_tree_bytes():
+    return TEST_FILE.read_bytes()
 
-        self.analysis_plugin = AnalysisPlugin(self, config=config)
 
-    def test_process_object(self):
+@pytest.fixture(scope='session')
+def embedded_bytes():
+    return TEST_EMBEDDED.read_bytes()
+
+
+@pytest.fixture(scope='session')
+def image_bytes():
+    return TEST_IMAGE.read_bytes()
+
+
+@pytest.fixture(scope='session')
+def fp_bytes():
+    return TEST_FP.read_bytes()
+
+
+@pytest.fixture(scope='session')
+def broken_bytes():
+    return TEST_BROKEN.read_bytes()
+
+
+@pytest.fixture(scope='module')
+def parsed_dtb(request):
+    # parametrized with the name of one of the test data fixtures above, so data is only loaded when it is needed
+    return dump_device_trees(request.getfixturevalue(request.param))
+
+
+@pytest.fixture(scope='class')
+def analysis_plugin():
+    config = get_config_for_testing()
+    config.add_section(AnalysisPlugin.NAME)
+    config.set(AnalysisPlugin.NAME, 'threads', '1')
+    with mock.patch('plugins.base.BasePlugin._sync_view', lambda self, plugin_path: None):
+        plugin = AnalysisPlugin(MockAdmin(), config=config, offline_testing=True)
+    yield plugin
+    plugin.shutdown()
+
+
+class TestDeviceTree:
+
+    def test_plugin_attributes(self, analysis_plugin):
+        assert analysis_plugin.NAME == 'device_tree'
+        assert isinstance(analysis_plugin.DESCRIPTION, str)
+        assert isinstance(analysis_plugin.VERSION, str)
+        assert analysis_plugin.VERSION != 'not set', 'Plug-in version not set'
+
+    def test_process_object(self, analysis_plugin, device_tree_bytes):
         test_object = FileObject()
-        test_object.binary = TEST_FILE.read_bytes()
-        processed_object = self.analysis_plugin.process_object(test_object)
-        result = processed_object.processed_analysis[self.PLUGIN_NAME]
+        test_object.binary = device_tree_bytes
+        processed_object = analysis_plugin.process_object(test_object)
+        result = processed_object.processed_analysis[AnalysisPlugin.NAME]
 
         assert len(result['device_trees']) == 1
         assert result['device_trees'][0]['model'] == 'Manufac XYZ1234ABC'
         assert result['summary'] == ['Manufac XYZ1234ABC']
 
 
-@pytest.mark.parametrize('file', [TEST_EMBEDDED, TEST_IMAGE])
-def test_dump_device_trees(file):
-    result = dump_device_trees(file.read_bytes())
-    assert len(result) == 2
-    for dt_dict in result:
+@pytest.mark.parametrize('parsed_dtb, offsets', [
+    ('embedded_bytes', [0, 144]),
+    ('image_bytes', [128, 272]),
+], indirect=['parsed_dtb'], ids=['embedded', 'image'])
+def test_dump_device_trees(parsed_dtb, offsets):
+    assert len(parsed_dtb) == 2
+    assert [dt_dict['offset'] for dt_dict in parsed_dtb] == offsets
+    for dt_dict in parsed_dtb:
         assert 'foo = "bar";' in dt_dict['device_tree']
         assert dt_dict['header']['version'] == 17
         assert dt_dict['model'] in ['DeviceTreeTest-1', 'FooBar 1.0']
 
 
-@pytest.mark.parametrize('file', [TEST_FP, TEST_BROKEN])
-def test_no_results(file):
-    result = dump_device_trees(file.read_bytes())
-    assert len(result) == 0
+@pytest.mark.parametrize('parsed_dtb', ['fp_bytes', 'broken_bytes'], indirect=True, ids=['fp', 'broken'])
+def test_no_results(parsed_dtb):
+    assert len(parsed_dtb) == 0
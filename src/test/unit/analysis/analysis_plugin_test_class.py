@@ -2,10 +2,28 @@ import gc
 import unittest
 import unittest.mock
 from configparser import ConfigParser
+from functools import lru_cache
+from typing import Dict
 
 from test.common_helper import DatabaseMock, create_docker_mount_base_dir, fake_exit, load_users_from_main_config
 
 
+@lru_cache(maxsize=None)
+def _get_basic_config_sections(plugin_name: str, docker_mount_base_dir: str) -> Dict[str, Dict[str, str]]:
+    config = ConfigParser()
+    config.add_section(plugin_name)
+    config.set(plugin_name, 'threads', '1')
+    config.add_section('ExpertSettings')
+    config.set('ExpertSettings', 'block_delay', '0.1')
+    config.add_section('data_storage')
+    load_users_from_main_config(config)
+    config.set('data_storage', 'mongo_server', 'localhost')
+    config.set('data_storage', 'mongo_port', '54321')
+    config.set('data_storage', 'view_storage', 'tmp_view')
+    config.set('data_storage', 'docker-mount-base-dir', docker_mount_base_dir)
+    return {section: dict(config.items(section, raw=True)) for section in config.sections()}
+
+
 class AnalysisPluginTest(unittest.TestCase):
     '''
     This is the base class for analysis plugin test.unit
@@ -34,17 +52,9 @@ class AnalysisPluginTest(unittest.TestCase):
         gc.collect()
 
     def init_basic_config(self):
+        # main.cfg is only parsed once per plugin; every test still gets its own (mutable) config object
         config = ConfigParser()
-        config.add_section(self.PLUGIN_NAME)
-        config.set(self.PLUGIN_NAME, 'threads', '1')
-        config.add_section('ExpertSettings')
-        config.set('ExpertSettings', 'block_delay', '0.1')
-        config.add_section('data_storage')
-        load_users_from_main_config(config)
-        config.set('data_storage', 'mongo_server', 'localhost')
-        config.set('data_storage', 'mongo_port', '54321')
-        config.set('data_storage', 'view_storage', 'tmp_view')
-        config.set('data_storage', 'docker-mount-base-dir', str(self.docker_mount_base_dir))
+        config.read_dict(_get_basic_config_sections(self.PLUGIN_NAME, str(self.docker_mount_base_dir)))
         return config
 
     def register_plugin(self, name, plugin_object):
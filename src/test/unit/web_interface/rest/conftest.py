@@ -2,6 +2,7 @@
 
 from tempfile import TemporaryDirectory
 
+import orjson
 import pytest
 
 from test.common_helper import DatabaseMock, fake_exit, get_config_for_testing
@@ -14,12 +15,13 @@ def mocking_the_database(monkeypatch):
     monkeypatch.setattr('helperFunctions.database.ConnectTo.__exit__', fake_exit)
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def test_config():
-    return get_config_for_testing(TemporaryDirectory())
+    with TemporaryDirectory() as tmp_dir:
+        yield get_config_for_testing(tmp_dir)
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def test_app(test_config):  # pylint: disable=redefined-outer-name
     frontend = WebFrontEnd(config=test_config)
     with frontend.app.test_client() as client:
@@ -27,4 +29,4 @@ def test_app(test_config):  # pylint: disable=redefined-outer-name
 
 
 def decode_response(response):
-    return response.json
+    return orjson.loads(response.data)
@@ -1,12 +1,16 @@
 import json
-from base64 import standard_b64encode
+from types import MappingProxyType
 from urllib.parse import quote
 
+import pytest
+
 from test.common_helper import TEST_FW
 from test.unit.web_interface.rest.conftest import decode_response
 
-TEST_FW_PAYLOAD = {
-    'binary': standard_b64encode(b'\x01\x23\x45\x67\x89').decode(),
+FW_URL = f'/rest/firmware/{TEST_FW.uid}'
+
+TEST_FW_PAYLOAD = MappingProxyType({
+    'binary': 'ASNFZ4k=',  # base64 of b'\x01\x23\x45\x67\x89'
     'file_name': 'no_real_file',
     'device_part': 'kernel',
     'device_name': 'no real device',
@@ -16,7 +20,12 @@ TEST_FW_PAYLOAD = {
     'vendor': 'no real vendor',
     'tags': 'tag1,tag2',
     'requested_analysis_systems': ['file_type']
-}
+})
+
+Q_VENDOR = quote(json.dumps({'vendor': 'no real vendor'}))
+UPDATE_OPTIONAL = quote(json.dumps(['optional_plugin']))
+UPDATE_UNPACKER = quote(json.dumps(['unpacker', 'optional_plugin']))
+Q_ARM_REGEX = quote(json.dumps({'processed_analysis.file_type.full': {'$regex': 'arm', '$options': 'si'}}))
 
 
 def test_successful_request(test_app):
@@ -27,11 +36,9 @@ def test_successful_request(test_app):
 
 
 def test_request_with_query(test_app):
-    query = {'vendor': 'no real vendor'}
-    quoted_query = quote(json.dumps(query))
-    response = decode_response(test_app.get(f'/rest/firmware?query={quoted_query}'))
+    response = decode_response(test_app.get(f'/rest/firmware?query={Q_VENDOR}'))
     assert 'query' in response['request'].keys()
-    assert response['request']['query'] == query
+    assert response['request']['query'] == {'vendor': 'no real vendor'}
 
 
 def test_bad_query(test_app):
@@ -62,7 +69,7 @@ def test_non_existing_uid(test_app):
 
 
 def test_successful_uid_request(test_app):
-    result = decode_response(test_app.get(f'/rest/firmware/{TEST_FW.uid}'))
+    result = decode_response(test_app.get(FW_URL))
     assert 'firmware' in result
     assert all(section in result['firmware'] for section in ['meta_data', 'analysis'])
 
@@ -78,93 +85,88 @@ def test_submit_empty_data(test_app):
 
 
 def test_submit_missing_item(test_app):
-    request_data = {**TEST_FW_PAYLOAD}
+    request_data = TEST_FW_PAYLOAD.copy()
     request_data.pop('vendor')
     result = decode_response(test_app.put('/rest/firmware', json=request_data))
     assert 'Input payload validation failed' in result['message']
     assert 'vendor' in result['errors']
 
 
+@pytest.mark.parametrize('pop_key, expected_request', [
+    ('tags', {}),
+    ('release_date', {'release_date': '1970-01-01'}),  # default value
+])
+def test_submit_missing_optional_item(test_app, pop_key, expected_request):
+    request_data = TEST_FW_PAYLOAD.copy()
+    request_data.pop(pop_key)
+    result = decode_response(test_app.put('/rest/firmware', json=request_data))
+    assert result['status'] == 0
+    assert result['request'].items() >= expected_request.items()
+
+
 def test_submit_invalid_binary(test_app):
-    request_data = {**TEST_FW_PAYLOAD, 'binary': 'invalid_base64'}
+    request_data = TEST_FW_PAYLOAD.copy()
+    request_data['binary'] = 'invalid_base64'
     result = decode_response(test_app.put('/rest/firmware', json=request_data))
     assert 'Could not parse binary (must be valid base64!)' in result['error_message']
 
 
 def test_submit_success(test_app):
-    result = decode_response(test_app.put('/rest/firmware', json=TEST_FW_PAYLOAD))
+    result = decode_response(test_app.put('/rest/firmware', json=TEST_FW_PAYLOAD.copy()))
     assert result['status'] == 0
 
 
 def test_request_update(test_app):
-    requested_analysis = json.dumps(['optional_plugin'])
-    result = decode_response(test_app.put(f'/rest/firmware/{TEST_FW.uid}?update={quote(requested_analysis)}'))
+    result = decode_response(test_app.put(f'{FW_URL}?update={UPDATE_OPTIONAL}'))
     assert result['status'] == 0
 
 
-def test_submit_no_tags(test_app):
-    request_data = {**TEST_FW_PAYLOAD}
-    request_data.pop('tags')
-    result = decode_response(test_app.put('/rest/firmware', json=request_data))
-    assert result['status'] == 0
-
-
-def test_submit_no_release_date(test_app):
-    request_data = {**TEST_FW_PAYLOAD}
-    request_data.pop('release_date')
-    result = decode_response(test_app.put('/rest/firmware', json=request_data))
-    assert result['status'] == 0
-    assert isinstance(result['request']['release_date'], str)
-    assert result['request']['release_date'] == '1970-01-01'
-
-
 def test_submit_invalid_release_date(test_app):
-    request_data = {**TEST_FW_PAYLOAD, 'release_date': 'invalid date'}
+    request_data = TEST_FW_PAYLOAD.copy()
+    request_data['release_date'] = 'invalid date'
     result = decode_response(test_app.put('/rest/firmware', json=request_data))
     assert result['status'] == 1
     assert 'Invalid date literal' in result['error_message']
 
 
 def test_request_update_bad_parameter(test_app):
-    result = decode_response(test_app.put(f'/rest/firmware/{TEST_FW.uid}?update=no_list'))
+    result = decode_response(test_app.put(f'{FW_URL}?update=no_list'))
     assert result['status'] == 1
     assert 'has to be a list' in result['error_message']
 
 
 def test_request_update_missing_parameter(test_app):  # pylint: disable=invalid-name
-    result = decode_response(test_app.put(f'/rest/firmware/{TEST_FW.uid}'))
+    result = decode_response(test_app.put(FW_URL))
     assert result['status'] == 1
     assert 'missing parameter: update' in result['error_message']
 
 
 def test_request_with_unpacking(test_app):
-    scheduled_analysis = ['unpacker', 'optional_plugin']
-    requested_analysis = json.dumps(scheduled_analysis)
-    result = decode_response(test_app.put(f'/rest/firmware/{TEST_FW.uid}?update={quote(requested_analysis)}'))
+    result = decode_response(test_app.put(f'{FW_URL}?update={UPDATE_UNPACKER}'))
     assert result['status'] == 0
-    assert sorted(result['request']['update']) == sorted(scheduled_analysis)
+    assert sorted(result['request']['update']) == ['optional_plugin', 'unpacker']
     assert 'unpacker' in result['request']['update']
 
 
-def test_request_with_bad_recursive_flag(test_app):  # pylint: disable=invalid-name
-    result = decode_response(test_app.get('/rest/firmware?recursive=true'))
+@pytest.mark.parametrize('url, error', [
+    ('/rest/firmware?recursive=true', 'only permissible with non-empty query'),
+    ('/rest/firmware?inverted=true&query={"foo": "bar"}', 'Inverted flag can only be used with recursive'),
+])
+def test_request_with_bad_flags(test_app, url, error):
+    result = decode_response(test_app.get(url))
     assert result['status'] == 1
-    assert 'only permissible with non-empty query' in result['error_message']
+    assert error in result['error_message']
 
-    query = json.dumps({'processed_analysis.file_type.full': {'$regex': 'arm', '$options': 'si'}})
-    result = decode_response(test_app.get(f'/rest/firmware?recursive=true&query={quote(query)}'))
-    assert result['status'] == 0
-
-
-def test_request_with_inverted_flag(test_app):
-    result = decode_response(test_app.get('/rest/firmware?inverted=true&query={"foo": "bar"}'))
-    assert result['status'] == 1
-    assert 'Inverted flag can only be used with recursive' in result['error_message']
 
-    result = decode_response(test_app.get('/rest/firmware?inverted=true&recursive=true&query={"foo": "bar"}'))
+@pytest.mark.parametrize('url', [
+    f'/rest/firmware?recursive=true&query={Q_ARM_REGEX}',
+    '/rest/firmware?inverted=true&recursive=true&query={"foo": "bar"}',
+])
+def test_request_with_flags(test_app, url):
+    result = decode_response(test_app.get(url))
     assert result['status'] == 0
 
 
 def test_request_with_summary_parameter(test_app):  # pylint: disable=invalid-name
-    result = decode_response(test_app.get(f'/rest/firmware/{TEST_FW.uid}?summary=true'))
+    result = decode_response(test_app.get(f'{FW_URL}?summary=true'))
     assert 'firmware' in result
@@ -1,5 +1,8 @@
+from test.unit.web_interface.rest.conftest import decode_response
+
+
 def test_missing(test_app):
-    result = test_app.get('/rest/missing').json
+    result = decode_response(test_app.get('/rest/missing'))
 
     assert 'missing_analyses' in result
     assert result['missing_analyses'] == {'root_fw_uid': ['missing_child_uid']}
@@ -1,5 +1,8 @@
+from test.unit.web_interface.rest.conftest import decode_response
+
+
 def test_empty_uid(test_app):
-    result = test_app.get('/rest/status').json
+    result = decode_response(test_app.get('/rest/status'))
 
     assert result['status'] == 0
     assert result['system_status'] == {
@@ -24,5 +27,5 @@ class StatisticDbViewerMock:
 
 def test_empty_result(test_app, monkeypatch):
     monkeypatch.setattr('helperFunctions.database.ConnectTo.__enter__', lambda _: StatisticDbViewerMock())
-    result = test_app.get('/rest/status').json
+    result = decode_response(test_app.get('/rest/status'))
     assert 'Cannot get FACT component status' in result['error_message']